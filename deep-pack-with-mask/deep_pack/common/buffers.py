@@ -1,3 +1,5 @@
+import os
+import tempfile
 import warnings
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Generator, List, Optional, Tuple, Union
@@ -20,6 +22,34 @@ try:
 except ImportError:
     psutil = None
 
+try:
+    # Fuse the per-field sample gathers into one parallel pass when available
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _gather_transitions(  # pragma: no cover - compiled
+        obs, next_obs, actions, rewards, dones, timeouts, truth_masks,
+        flat_idx, next_flat_idx,
+        out_obs, out_next_obs, out_actions, out_rewards, out_masked_dones, out_truth_masks,
+    ):
+        for k in prange(flat_idx.shape[0]):
+            i = flat_idx[k]
+            out_obs[k] = obs[i]
+            out_next_obs[k] = next_obs[next_flat_idx[k]]
+            out_actions[k] = actions[i]
+            out_rewards[k] = rewards[i]
+            out_masked_dones[k, 0] = dones[i] * (1.0 - timeouts[i])
+            for j in range(truth_masks.shape[1]):
+                out_truth_masks[k, j] = truth_masks[i, j]
+
+else:
+    _gather_transitions = None
+
 
 class ReplayBuffer(BaseBuffer):
     """
@@ -39,6 +69,15 @@ class ReplayBuffer(BaseBuffer):
     :param handle_timeout_termination: Handle timeout termination (due to timelimit)
         separately and treat the task as infinite horizon task.
         https://github.com/DLR-RM/stable-baselines3/issues/284
+    :param obs_dtype: Optional dtype override for the observation storage
+        (e.g. ``np.float16`` for high-dimensional float observations),
+        defaults to the observation space dtype. ``np.float16`` is not
+        supported by numba, so it disables the fused sample gather.
+    :param backing: Where to keep the observation storage: ``"ram"`` (default)
+        or ``"memmap"`` to back it with temporary files on disk, which allows
+        replay buffers larger than the available memory. Saving such a buffer
+        streams its contents into the pickle; loading rehydrates them into
+        fresh temporary files.
     """
 
     observations: np.ndarray
@@ -49,6 +88,10 @@ class ReplayBuffer(BaseBuffer):
     timeouts: np.ndarray
     truth_masks: np.ndarray
 
+    # Byte alignment of each field inside the pinned staging arenas,
+    # one cache line so no field straddles another field's line
+    STAGING_ALIGNMENT = 64
+
     def __init__(
         self,
         buffer_size: int,
@@ -58,6 +101,8 @@ class ReplayBuffer(BaseBuffer):
         n_envs: int = 1,
         optimize_memory_usage: bool = False,
         handle_timeout_termination: bool = True,
+        obs_dtype: Optional[np.typing.DTypeLike] = None,
+        backing: str = "ram",
     ):
         super().__init__(buffer_size, observation_space, action_space, device, n_envs=n_envs)
 
@@ -77,27 +122,63 @@ class ReplayBuffer(BaseBuffer):
             )
         self.optimize_memory_usage = optimize_memory_usage
 
-        self.observations = np.zeros((self.buffer_size, self.n_envs, *self.obs_shape), dtype=observation_space.dtype)
+        if optimize_memory_usage:
+            # Round the capacity up to the next power of two so the circular
+            # `% buffer_size` lookups in sample/_get_samples become a bitmask
+            # (& (size - 1)), a much cheaper ufunc than integer modulo.
+            # The extra slots are regular usable capacity
+            self.buffer_size = 1 << (self.buffer_size - 1).bit_length()
+            self._pos_mask: Optional[int] = self.buffer_size - 1
+        else:
+            self._pos_mask = None
+
+        if backing not in ("ram", "memmap"):
+            raise ValueError(f"Unknown replay buffer backing: {backing}, must be 'ram' or 'memmap'")
+        self.backing = backing
+        self._memmap_files: List[Any] = []
+
+        obs_dtype = observation_space.dtype if obs_dtype is None else np.dtype(obs_dtype)
+        self.observations = self._allocate_obs((self.n_envs, self.buffer_size, *self.obs_shape), obs_dtype)
 
         if not optimize_memory_usage:
             # When optimizing memory, `observations` contains also the next observation
-            self.next_observations = np.zeros((self.buffer_size, self.n_envs, *self.obs_shape), dtype=observation_space.dtype)
+            self.next_observations = self._allocate_obs((self.n_envs, self.buffer_size, *self.obs_shape), obs_dtype)
 
-        self.actions = np.zeros(
-            (self.buffer_size, self.n_envs, self.action_dim), dtype=self._maybe_cast_dtype(action_space.dtype)
+        # np.empty leaves the pages untouched: the kernel zeroes them lazily on
+        # first write, so constructing GB-scale buffers is near-instant and RSS
+        # only grows as slots are filled. Sampling never reads beyond self.pos
+        # (or wraps only after `full`), so uninitialized slots are never read
+        self.actions = np.empty(
+            (self.n_envs, self.buffer_size, self.action_dim), dtype=self._maybe_cast_dtype(action_space.dtype)
         )
 
-        self.rewards = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
-        self.dones = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
+        self.rewards = np.empty((self.n_envs, self.buffer_size), dtype=np.float32)
+        # dones/timeouts are {0, 1} indicators and truth masks are {0, 1} per action:
+        # store them as single bytes and cast to float32 only at sample time
+        self.dones = np.empty((self.n_envs, self.buffer_size), dtype=np.bool_)
         # Handle timeouts termination properly if needed
         # see https://github.com/DLR-RM/stable-baselines3/issues/284
         self.handle_timeout_termination = handle_timeout_termination
-        self.timeouts = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
-        self.truth_masks = np.zeros((self.buffer_size, self.n_envs, self.action_space.n), dtype=np.float32)
+        # timeouts must stay zero-initialized: it is read at sample time even
+        # when handle_timeout_termination is False and `add` never writes it
+        self.timeouts = np.zeros((self.n_envs, self.buffer_size), dtype=np.bool_)
+        # Scratch array filled in-place in `add` to avoid building
+        # a fresh numpy array from a list comprehension every step
+        self._timeouts_scratch = np.zeros(self.n_envs, dtype=np.bool_)
+        self._init_truth_masks()
+        self._init_flat_views()
+        self._init_staging()
+        # PCG64 generator, noticeably faster than the legacy np.random API
+        self._rng = np.random.default_rng()
 
         if psutil is not None:
             total_memory_usage: float = (
-                self.observations.nbytes + self.actions.nbytes + self.rewards.nbytes + self.dones.nbytes
+                self.observations.nbytes
+                + self.actions.nbytes
+                + self.rewards.nbytes
+                + self.dones.nbytes
+                + self.timeouts.nbytes
+                + self.truth_masks.nbytes
             )
 
             if not optimize_memory_usage:
@@ -131,22 +212,25 @@ class ReplayBuffer(BaseBuffer):
         # Reshape to handle multi-dim and discrete action spaces, see GH #970 #1392
         action = action.reshape((self.n_envs, self.action_dim))
 
-        # Copy to avoid modification by reference
-        self.observations[self.pos] = np.array(obs)
+        # Slice assignment already copies into the storage arrays,
+        # no need for an intermediate `np.array(...)` copy
+        self.observations[:, self.pos] = obs
 
         if self.optimize_memory_usage:
-            self.observations[(self.pos + 1) % self.buffer_size] = np.array(next_obs)
+            self.observations[:, (self.pos + 1) & self._pos_mask] = next_obs
         else:
-            self.next_observations[self.pos] = np.array(next_obs)
+            self.next_observations[:, self.pos] = next_obs
 
-        self.actions[self.pos] = np.array(action)
-        self.rewards[self.pos] = np.array(reward)
-        self.dones[self.pos] = np.array(done)
+        self.actions[:, self.pos] = action
+        self.rewards[:, self.pos] = reward
+        self.dones[:, self.pos] = done
 
         if self.handle_timeout_termination:
-            self.timeouts[self.pos] = np.array([info.get("TimeLimit.truncated", False) for info in infos])
-        
-        self.truth_masks[self.pos] = np.array(truth_mask)
+            for i, info in enumerate(infos):
+                self._timeouts_scratch[i] = info.get("TimeLimit.truncated", False)
+            self.timeouts[:, self.pos] = self._timeouts_scratch
+
+        self._store_truth_mask(truth_mask)
 
         self.pos += 1
         if self.pos == self.buffer_size:
@@ -166,35 +250,449 @@ class ReplayBuffer(BaseBuffer):
         :return:
         """
         if not self.optimize_memory_usage:
-            return super().sample(batch_size=batch_size, env=env)
+            upper_bound = self.buffer_size if self.full else self.pos
+            batch_inds = self._rng.integers(0, upper_bound, size=batch_size, dtype=np.int64)
+            return self._get_samples(batch_inds, env=env)
         # Do not sample the element with index `self.pos` as the transitions is invalid
         # (we use only one array to store `obs` and `next_obs`)
         if self.full:
-            batch_inds = (np.random.randint(1, self.buffer_size, size=batch_size) + self.pos) % self.buffer_size
+            batch_inds = (self._rng.integers(1, self.buffer_size, size=batch_size, dtype=np.int64) + self.pos) & self._pos_mask
         else:
-            batch_inds = np.random.randint(0, self.pos, size=batch_size)
+            batch_inds = self._rng.integers(0, self.pos, size=batch_size, dtype=np.int64)
         return self._get_samples(batch_inds, env=env)
 
+    def sample_combined(
+        self, batch_size: int, n_combined: int, env: Optional[VecNormalize] = None
+    ) -> Generator[ReplayBufferSamples, None, None]:
+        """
+        Sample ``n_combined`` minibatches in one combined draw.
+
+        The indices for all minibatches are drawn at once and every field is
+        gathered and moved to the device in a single pass, so the PRNG,
+        indexing and host-to-device transfer costs are paid once instead of
+        ``n_combined`` times. The yielded minibatches are views into the
+        combined tensors and must be consumed before the next sample call.
+
+        :param batch_size: Number of elements per minibatch
+        :param n_combined: Number of minibatches to prepare at once
+        :param env: associated gym VecEnv
+            to normalize the observations/rewards when sampling
+        :return: Iterator over ``n_combined`` minibatches
+        """
+        combined = self.sample(batch_size * n_combined, env=env)
+        for i in range(n_combined):
+            start, stop = i * batch_size, (i + 1) * batch_size
+            yield ReplayBufferSamples(*(field[start:stop] for field in combined))
+
     def _get_samples(self, batch_inds: np.ndarray, env: Optional[VecNormalize] = None) -> ReplayBufferSamples:
-        # Sample randomly the env idx
-        env_indices = np.random.randint(0, high=self.n_envs, size=(len(batch_inds),))
+        batch_size = len(batch_inds)
+
+        if self._pin_memory:
+            self._staging_slot = 1 - self._staging_slot
 
+        # Single linear index into the flattened (n_envs * buffer_size) axis,
+        # reused for every field instead of six independent fancy-index passes.
+        # With a single env the only legal env index is 0, so the RNG draw and
+        # the index arithmetic reduce to batch_inds itself
+        if self.n_envs == 1:
+            flat_idx = batch_inds
+        else:
+            # Sample randomly the env idx
+            env_indices = self._rng.integers(0, high=self.n_envs, size=batch_size, dtype=np.int64)
+            flat_idx = env_indices * self.buffer_size + batch_inds
         if self.optimize_memory_usage:
-            next_obs = self._normalize_obs(self.observations[(batch_inds + 1) % self.buffer_size, env_indices, :], env)
+            next_src = self._observations_flat
+            next_flat_idx = (batch_inds + 1) & self._pos_mask
+            if self.n_envs > 1:
+                next_flat_idx += env_indices * self.buffer_size
         else:
-            next_obs = self._normalize_obs(self.next_observations[batch_inds, env_indices, :], env)
+            next_src = self._next_observations_flat
+            next_flat_idx = flat_idx
+
+        obs_buf = self._sample_buf("obs", (batch_size, *self.obs_shape), self.observations.dtype)
+        next_obs_buf = self._sample_buf("next_obs", (batch_size, *self.obs_shape), self.observations.dtype)
+        actions_buf = self._sample_buf("actions", (batch_size, self.action_dim), self.actions.dtype)
+        rewards_buf = self._sample_buf("rewards", (batch_size, 1), self.rewards.dtype)
+        rewards_flat = rewards_buf.reshape(-1)
+        truth_masks_buf = self._sample_buf("truth_masks", (batch_size, self.action_space.n), np.float32)
+        masked_dones_buf = self._sample_buf("masked_dones", (batch_size, 1), np.float32)
+
+        if self._numba_gather:
+            # When masks are bit-packed, gather the raw bytes and unpack
+            # afterwards; otherwise the kernel widens straight into float32
+            if self._pack_masks:
+                mask_out = self._scratch_buf("truth_masks_u8", (batch_size, self.truth_masks.shape[-1]), np.uint8)
+            else:
+                mask_out = truth_masks_buf
+            # One parallel pass over the minibatch fills every staging buffer,
+            # including the mask gather and the fused
+            # dones * (1 - timeouts) computation
+            _gather_transitions(
+                self._observations_flat, next_src, self._actions_flat,
+                self._rewards_flat, self._dones_flat, self._timeouts_flat, self._truth_masks_flat,
+                flat_idx, next_flat_idx,
+                obs_buf, next_obs_buf, actions_buf, rewards_flat, masked_dones_buf, mask_out,
+            )
+            if self._pack_masks:
+                np.copyto(truth_masks_buf, np.unpackbits(mask_out, axis=-1, count=self.action_space.n))
+        else:
+            np.take(self._observations_flat, flat_idx, axis=0, out=obs_buf)
+            np.take(next_src, next_flat_idx, axis=0, out=next_obs_buf)
+            np.take(self._actions_flat, flat_idx, axis=0, out=actions_buf)
+            np.take(self._rewards_flat, flat_idx, axis=0, out=rewards_flat)
+
+            dones_buf = self._scratch_buf("dones", (batch_size,), self.dones.dtype)
+            np.take(self._dones_flat, flat_idx, axis=0, out=dones_buf)
+            timeouts_buf = self._scratch_buf("timeouts", (batch_size,), self.timeouts.dtype)
+            np.take(self._timeouts_flat, flat_idx, axis=0, out=timeouts_buf)
+
+            # Gather the mask bytes, then unpack/widen to float32 once
+            truth_masks_u8 = self._scratch_buf("truth_masks_u8", (batch_size, self.truth_masks.shape[-1]), np.uint8)
+            np.take(self._truth_masks_flat, flat_idx, axis=0, out=truth_masks_u8)
+            if self._pack_masks:
+                np.copyto(truth_masks_buf, np.unpackbits(truth_masks_u8, axis=-1, count=self.action_space.n))
+            else:
+                np.copyto(truth_masks_buf, truth_masks_u8)
 
-        data = (
-            self._normalize_obs(self.observations[batch_inds, env_indices, :], env),
-            self.actions[batch_inds, env_indices, :],
-            next_obs,
             # Only use dones that are not due to timeouts
-            # deactivated by default (timeouts is initialized as an array of False)
-            (self.dones[batch_inds, env_indices] * (1 - self.timeouts[batch_inds, env_indices])).reshape(-1, 1),
-            self._normalize_reward(self.rewards[batch_inds, env_indices].reshape(-1, 1), env),
-            self.truth_masks[batch_inds, env_indices, :],
+            # deactivated by default (timeouts is initialized as an array of False).
+            # Computed with in-place ufuncs into a pooled buffer: no temporaries
+            masked_dones_flat = masked_dones_buf.reshape(-1)
+            np.subtract(1.0, timeouts_buf, out=masked_dones_flat)
+            np.multiply(dones_buf, masked_dones_flat, out=masked_dones_flat)
+
+        batch = self._transfer_batch(
+            {
+                "obs": self._normalize_obs(obs_buf, env),
+                "next_obs": self._normalize_obs(next_obs_buf, env),
+                "actions": actions_buf,
+                "rewards": self._normalize_reward(rewards_buf, env),
+                "masked_dones": masked_dones_buf,
+                "truth_masks": truth_masks_buf,
+            }
+        )
+        return ReplayBufferSamples(
+            observations=batch["obs"],
+            actions=batch["actions"],
+            next_observations=batch["next_obs"],
+            dones=batch["masked_dones"],
+            rewards=batch["rewards"],
+            truth_masks=batch["truth_masks"],
         )
-        return ReplayBufferSamples(*tuple(map(self.to_torch, data)))
+
+    def _init_truth_masks(self) -> None:
+        """
+        Allocate the action-mask storage, shared by both buffer variants.
+
+        For large action spaces the {0, 1} masks are packed 8 actions per
+        byte with ``np.packbits`` (8x smaller than byte-per-action storage);
+        sampling unpacks them with a single vectorized ``np.unpackbits``.
+        Small masks stay one byte per action, where packing does not pay off.
+        """
+        self._pack_masks = self.action_space.n >= 32
+        mask_width = (self.action_space.n + 7) // 8 if self._pack_masks else self.action_space.n
+        self.truth_masks = np.empty((self.n_envs, self.buffer_size, mask_width), dtype=np.uint8)
+
+    def _init_flat_views(self) -> None:
+        """
+        (Re)build the flat views over the (n_envs, buffer_size) leading axes
+        so that sampling is a single linear gather per field (reshape of a
+        contiguous array is free). Called from ``__init__`` and again on
+        unpickling, where the views must be rebuilt because pickling
+        detaches them from their storage (see ``__setstate__``).
+        """
+        self._observations_flat = self.observations.reshape(-1, *self.obs_shape)
+        if not self.optimize_memory_usage:
+            self._next_observations_flat = self.next_observations.reshape(-1, *self.obs_shape)
+        self._actions_flat = self.actions.reshape(-1, self.action_dim)
+        self._rewards_flat = self.rewards.reshape(-1)
+        self._dones_flat = self.dones.reshape(-1)
+        self._timeouts_flat = self.timeouts.reshape(-1)
+        self._truth_masks_flat = self.truth_masks.reshape(-1, self.truth_masks.shape[-1])
+
+    def _store_truth_mask(self, truth_mask: np.ndarray) -> None:
+        """
+        Write one step of action masks into the storage, packing to a bitset
+        when the action space is large (see ``_init_truth_masks``).
+
+        :param truth_mask: Array of shape ``(n_envs, action_space.n)``
+        """
+        if self._pack_masks:
+            self.truth_masks[:, self.pos] = np.packbits(truth_mask.astype(np.uint8, copy=False), axis=-1)
+        else:
+            self.truth_masks[:, self.pos] = truth_mask
+
+    def _allocate_obs(self, shape: Tuple[int, ...], dtype: np.typing.DTypeLike) -> np.ndarray:
+        """
+        Allocate one observation storage array.
+
+        With ``backing="memmap"`` the array lives in a temporary file and the
+        OS pages it in and out on demand, so the buffer can exceed available
+        RAM. Writes are sequential-circular, which the pagecache handles well;
+        random reads at sample time are acceptable on SSD/NVMe storage.
+
+        :param shape: Shape of the storage array
+        :param dtype: Dtype of the storage array
+        :return: The allocated array
+        """
+        if self.backing == "ram":
+            # np.empty: pages are zeroed lazily by the kernel on first access
+            return np.empty(shape, dtype=dtype)
+        # Keep a reference to the file object: the file is deleted once
+        # the buffer (and with it the mapping) is garbage collected
+        tmp_file = tempfile.NamedTemporaryFile(prefix="replay_buffer_", suffix=".dat")
+        self._memmap_files.append(tmp_file)
+        array = np.memmap(tmp_file.name, dtype=dtype, mode="w+", shape=shape)
+        try:
+            # Advise the kernel about the circular write pattern
+            os.posix_fadvise(tmp_file.fileno(), 0, array.nbytes, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass
+        return array
+
+    def _init_staging(self) -> None:
+        """
+        Set up the lazily-filled sampling staging state, shared by both
+        buffer variants.
+
+        On CUDA each staging slot is one pinned (page-locked) host arena
+        holding every minibatch field at aligned offsets, mirrored by one
+        device-side arena, so a whole sample moves with a single
+        asynchronous copy (see ``_transfer_batch``). Two slots are rotated
+        so an arena is never refilled while its previous async copy may
+        still be in flight.
+        """
+        self._pin_memory = self.device.type == "cuda"
+        # key -> numpy view over the slot's pinned arena
+        # (plain pooled arrays on CPU, where nothing is transferred)
+        self._sample_bufs: List[Dict[str, np.ndarray]] = [{}, {}]
+        self._arena_specs: List[Dict[str, Tuple[Tuple[int, ...], np.dtype]]] = [{}, {}]
+        self._arena_offsets: List[Dict[str, int]] = [{}, {}]
+        self._host_arenas: List[Optional[th.Tensor]] = [None, None]
+        # Matching device-side arenas: pointers stay stable across calls,
+        # so the hot loop never triggers a CUDA allocation
+        self._device_arenas: List[Optional[th.Tensor]] = [None, None]
+        self._device_views: List[Dict[str, th.Tensor]] = [{}, {}]
+        # CPU-only gather scratch, consumed within `_get_samples` itself:
+        # never transferred, so no pinning and no slot rotation
+        self._scratch_bufs: Dict[str, np.ndarray] = {}
+        self._staging_slot = 0
+        # numba cannot compile float16, so half-precision observation
+        # storage (obs_dtype=np.float16) falls back to the np.take gathers.
+        # Dict buffers always gather per key and never use the fused kernel
+        self._numba_gather = (
+            _gather_transitions is not None
+            and isinstance(self.observations, np.ndarray)
+            and self.observations.dtype != np.float16
+        )
+
+    # Derived state that must not be pickled: numpy view aliasing does not
+    # survive pickling (the flat views come back as detached copies of the
+    # storage, so `add` and `_get_samples` would silently diverge), and the
+    # pinned/device staging arenas are tied to this process. Everything
+    # listed here is rebuilt in ``__setstate__``
+    _DERIVED_ATTRS = (
+        "_observations_flat",
+        "_next_observations_flat",
+        "_actions_flat",
+        "_rewards_flat",
+        "_dones_flat",
+        "_timeouts_flat",
+        "_truth_masks_flat",
+        "_pin_memory",
+        "_sample_bufs",
+        "_arena_specs",
+        "_arena_offsets",
+        "_host_arenas",
+        "_device_arenas",
+        "_device_views",
+        "_scratch_bufs",
+        "_staging_slot",
+        "_numba_gather",
+        "_memmap_files",
+    )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Gets state for pickling, excluding the derived state listed in
+        ``_DERIVED_ATTRS``.
+
+        With ``backing="memmap"`` the open temp-file handles cannot be
+        pickled, and the mapped arrays would dangle in another process:
+        the observation storage is pickled as plain arrays instead, which
+        streams the buffer contents into the pickle.
+        """
+        state = self.__dict__.copy()
+        for key in self._DERIVED_ATTRS:
+            state.pop(key, None)
+        if self.backing == "memmap":
+            for name in ("observations", "next_observations"):
+                storage = state.get(name)
+                if isinstance(storage, dict):
+                    state[name] = {key: np.asarray(arr) for key, arr in storage.items()}
+                elif storage is not None:
+                    state[name] = np.asarray(storage)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restores pickle state and rebuilds the flat storage views and the
+        staging state that ``__getstate__`` excluded. A memmap-backed
+        buffer is rehydrated into fresh temporary files, so the loaded
+        buffer keeps the memmap footprint instead of staying resident.
+        """
+        self.__dict__.update(state)
+        self._memmap_files = []
+        if self.backing == "memmap":
+            for name in ("observations", "next_observations"):
+                storage = getattr(self, name, None)
+                if isinstance(storage, dict):
+                    setattr(self, name, {key: self._rehydrate_obs(arr) for key, arr in storage.items()})
+                elif storage is not None:
+                    setattr(self, name, self._rehydrate_obs(storage))
+        self._init_flat_views()
+        self._init_staging()
+
+    def _rehydrate_obs(self, array: np.ndarray) -> np.ndarray:
+        """
+        Copy one unpickled observation storage array back into a fresh
+        memmap allocation (see ``__setstate__``).
+
+        :param array: In-RAM array restored from the pickle
+        :return: The memmap-backed replacement holding the same data
+        """
+        storage = self._allocate_obs(array.shape, array.dtype)
+        np.copyto(storage, array)
+        return storage
+
+    def _sample_buf(self, key: str, shape: Tuple[int, ...], dtype: np.typing.DTypeLike) -> np.ndarray:
+        """
+        Return the reusable output buffer for one sampled field,
+        (re)allocating it lazily when the requested shape changes.
+        On CUDA the buffer is a view into the staging slot's pinned arena.
+
+        :param key: Name of the field (e.g. ``"obs"``)
+        :param shape: Shape of the minibatch output
+        :param dtype: Dtype of the storage array
+        :return: A writable scratch array of the requested shape
+        """
+        bufs = self._sample_bufs[self._staging_slot]
+        buf = bufs.get(key)
+        if buf is None or buf.shape != shape:
+            if self._pin_memory:
+                self._arena_specs[self._staging_slot][key] = (shape, np.dtype(dtype))
+                self._build_arena(self._staging_slot)
+                buf = self._sample_bufs[self._staging_slot][key]
+            else:
+                buf = np.empty(shape, dtype=dtype)
+                bufs[key] = buf
+        return buf
+
+    def _scratch_buf(self, key: str, shape: Tuple[int, ...], dtype: np.typing.DTypeLike) -> np.ndarray:
+        """
+        Return a reusable CPU-only scratch array for intermediates that never
+        leave the host (e.g. raw dones/timeouts before fusing).
+
+        :param key: Name of the intermediate
+        :param shape: Shape of the scratch array
+        :param dtype: Dtype of the scratch array
+        :return: A writable scratch array of the requested shape
+        """
+        buf = self._scratch_bufs.get(key)
+        if buf is None or buf.shape != shape:
+            buf = np.empty(shape, dtype=dtype)
+            self._scratch_bufs[key] = buf
+        return buf
+
+    def _build_arena(self, slot: int) -> None:
+        """
+        (Re)build the pinned host arena for one staging slot from the
+        registered field specs.
+
+        All transferred minibatch fields live in a single page-locked
+        allocation at ``STAGING_ALIGNMENT``-aligned offsets, so the
+        host-to-device move in ``_transfer_batch`` is one
+        ``cudaMemcpyAsync`` for the whole minibatch instead of one per
+        field. Rebuilds only happen when a field is first requested or a
+        minibatch shape changes, never in the steady state.
+
+        :param slot: Index of the staging slot to rebuild
+        """
+        specs = self._arena_specs[slot]
+        offsets = {}
+        total = 0
+        for key, (shape, dtype) in specs.items():
+            align = ReplayBuffer.STAGING_ALIGNMENT
+            total = (total + align - 1) // align * align
+            offsets[key] = total
+            total += int(np.prod(shape)) * dtype.itemsize
+        arena = th.empty(total, dtype=th.uint8, pin_memory=True)
+        arena_np = arena.numpy()
+        views = {}
+        for key, (shape, dtype) in specs.items():
+            nbytes = int(np.prod(shape)) * dtype.itemsize
+            views[key] = arena_np[offsets[key] : offsets[key] + nbytes].view(dtype).reshape(shape)
+        self._host_arenas[slot] = arena
+        self._arena_offsets[slot] = offsets
+        self._sample_bufs[slot] = views
+        # The matching device-side arena is rebuilt lazily on next transfer
+        self._device_arenas[slot] = None
+        self._device_views[slot] = {}
+
+    def _transfer_batch(self, fields: Dict[str, np.ndarray]) -> Dict[str, th.Tensor]:
+        """
+        Move one sampled minibatch to ``self.device``.
+
+        On CUDA every field already sits in the slot's pinned arena (fields
+        replaced by a normalization copy are written back first), so the
+        whole minibatch moves with a single asynchronous copy into the
+        pre-allocated device arena and is handed back as per-field tensor
+        views: one ``cudaMemcpyAsync`` instead of one per field, overlapping
+        with compute and with no CUDA allocation in the hot loop. The slot
+        is only reused two samples later, after the training step consuming
+        it has been issued.
+
+        Fields whose dtype no longer matches their arena slot (VecNormalize
+        promotes e.g. uint8 observations to float) cannot join the fused
+        copy and are moved individually through ``to_torch`` instead.
+
+        :param fields: Mapping from staging-buffer key to the sampled array
+        :return: The corresponding torch tensors on the buffer device
+        """
+        if not self._pin_memory:
+            return {key: self.to_torch(array) for key, array in fields.items()}
+        slot = self._staging_slot
+        host_views = self._sample_bufs[slot]
+        tensors: Dict[str, th.Tensor] = {}
+        for key, array in fields.items():
+            view = host_views[key]
+            if np.may_share_memory(array, view):
+                continue
+            if array.dtype == view.dtype:
+                # VecNormalize returned a scaled copy: write it back into the arena
+                np.copyto(view, array.reshape(view.shape))
+            else:
+                # Normalization changed the dtype: the field no longer fits
+                # its arena slot, so it takes the plain transfer path
+                tensors[key] = self.to_torch(array)
+        host_arena = self._host_arenas[slot]
+        device_arena = self._device_arenas[slot]
+        if device_arena is None:
+            device_arena = th.empty_like(host_arena, device=self.device)
+            device_views = {}
+            for key, (shape, dtype) in self._arena_specs[slot].items():
+                offset = self._arena_offsets[slot][key]
+                nbytes = int(np.prod(shape)) * dtype.itemsize
+                th_dtype = th.from_numpy(np.empty((), dtype=dtype)).dtype
+                device_views[key] = device_arena[offset : offset + nbytes].view(th_dtype).view(shape)
+            self._device_arenas[slot] = device_arena
+            self._device_views[slot] = device_views
+        device_arena.copy_(host_arena, non_blocking=True)
+        device_views = self._device_views[slot]
+        for key in fields:
+            if key not in tensors:
+                tensors[key] = device_views[key]
+        return tensors
 
     @staticmethod
     def _maybe_cast_dtype(dtype: np.typing.DTypeLike) -> np.typing.DTypeLike:
@@ -227,6 +725,14 @@ class DictReplayBuffer(ReplayBuffer):
     :param handle_timeout_termination: Handle timeout termination (due to timelimit)
         separately and treat the task as infinite horizon task.
         https://github.com/DLR-RM/stable-baselines3/issues/284
+    :param obs_dtype: Optional dtype override for the observation storage
+        (e.g. ``np.float16`` for high-dimensional float observations),
+        defaults to the per-key observation space dtype.
+    :param backing: Where to keep the observation storage: ``"ram"`` (default)
+        or ``"memmap"`` to back it with temporary files on disk, which allows
+        replay buffers larger than the available memory. Saving such a buffer
+        streams its contents into the pickle; loading rehydrates them into
+        fresh temporary files.
     """
 
     observation_space: spaces.Dict
@@ -243,6 +749,8 @@ class DictReplayBuffer(ReplayBuffer):
         n_envs: int = 1,
         optimize_memory_usage: bool = False,
         handle_timeout_termination: bool = True,
+        obs_dtype: Optional[np.typing.DTypeLike] = None,
+        backing: str = "ram",
     ):
         super(ReplayBuffer, self).__init__(buffer_size, observation_space, action_space, device, n_envs=n_envs)
 
@@ -258,33 +766,66 @@ class DictReplayBuffer(ReplayBuffer):
         # https://github.com/DLR-RM/stable-baselines3/pull/243#discussion_r531535702
         self.optimize_memory_usage = optimize_memory_usage
 
+        if backing not in ("ram", "memmap"):
+            raise ValueError(f"Unknown replay buffer backing: {backing}, must be 'ram' or 'memmap'")
+        self.backing = backing
+        self._memmap_files: List[Any] = []
+
         self.observations = {
-            key: np.zeros((self.buffer_size, self.n_envs, *_obs_shape), dtype=observation_space[key].dtype)
+            key: self._allocate_obs(
+                (self.n_envs, self.buffer_size, *_obs_shape),
+                observation_space[key].dtype if obs_dtype is None else np.dtype(obs_dtype),
+            )
             for key, _obs_shape in self.obs_shape.items()
         }
         self.next_observations = {
-            key: np.zeros((self.buffer_size, self.n_envs, *_obs_shape), dtype=observation_space[key].dtype)
+            key: self._allocate_obs(
+                (self.n_envs, self.buffer_size, *_obs_shape),
+                observation_space[key].dtype if obs_dtype is None else np.dtype(obs_dtype),
+            )
             for key, _obs_shape in self.obs_shape.items()
         }
 
-        self.actions = np.zeros(
-            (self.buffer_size, self.n_envs, self.action_dim), dtype=self._maybe_cast_dtype(action_space.dtype)
+        # np.empty leaves the pages untouched: the kernel zeroes them lazily on
+        # first write, so constructing GB-scale buffers is near-instant and RSS
+        # only grows as slots are filled. Sampling never reads beyond self.pos
+        # (or wraps only after `full`), so uninitialized slots are never read
+        self.actions = np.empty(
+            (self.n_envs, self.buffer_size, self.action_dim), dtype=self._maybe_cast_dtype(action_space.dtype)
         )
-        self.rewards = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
-        self.dones = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
+        self.rewards = np.empty((self.n_envs, self.buffer_size), dtype=np.float32)
+        # dones/timeouts are {0, 1} indicators and truth masks are {0, 1} per action:
+        # store them as single bytes and cast to float32 only at sample time
+        self.dones = np.empty((self.n_envs, self.buffer_size), dtype=np.bool_)
 
         # Handle timeouts termination properly if needed
         # see https://github.com/DLR-RM/stable-baselines3/issues/284
         self.handle_timeout_termination = handle_timeout_termination
-        self.timeouts = np.zeros((self.buffer_size, self.n_envs), dtype=np.float32)
-        self.truth_masks = np.zeros((self.buffer_size, self.n_envs, self.action_space.n), dtype=np.float32)
+        # timeouts must stay zero-initialized: it is read at sample time even
+        # when handle_timeout_termination is False and `add` never writes it
+        self.timeouts = np.zeros((self.n_envs, self.buffer_size), dtype=np.bool_)
+        # Scratch array filled in-place in `add` to avoid building
+        # a fresh numpy array from a list comprehension every step
+        self._timeouts_scratch = np.zeros(self.n_envs, dtype=np.bool_)
+        self._init_truth_masks()
+        self._init_flat_views()
+        self._init_staging()
+        # PCG64 generator, noticeably faster than the legacy np.random API
+        self._rng = np.random.default_rng()
 
         if psutil is not None:
             obs_nbytes = 0
             for _, obs in self.observations.items():
                 obs_nbytes += obs.nbytes
 
-            total_memory_usage: float = obs_nbytes + self.actions.nbytes + self.rewards.nbytes + self.dones.nbytes
+            total_memory_usage: float = (
+                obs_nbytes
+                + self.actions.nbytes
+                + self.rewards.nbytes
+                + self.dones.nbytes
+                + self.timeouts.nbytes
+                + self.truth_masks.nbytes
+            )
             if not optimize_memory_usage:
                 next_obs_nbytes = 0
                 for _, obs in self.observations.items():
@@ -300,6 +841,26 @@ class DictReplayBuffer(ReplayBuffer):
                     f"replay buffer {total_memory_usage:.2f}GB > {mem_available:.2f}GB"
                 )
 
+    def _init_flat_views(self) -> None:
+        """
+        (Re)build the flat views over the (n_envs, buffer_size) leading axes
+        so that sampling is a single linear gather per field (reshape of a
+        contiguous array is free). Observations are dicts here, so each key
+        gets its own flat view. Called from ``__init__`` and again on
+        unpickling (see ``ReplayBuffer.__setstate__``).
+        """
+        self._observations_flat = {
+            key: obs.reshape(-1, *self.obs_shape[key]) for key, obs in self.observations.items()
+        }
+        self._next_observations_flat = {
+            key: obs.reshape(-1, *self.obs_shape[key]) for key, obs in self.next_observations.items()
+        }
+        self._actions_flat = self.actions.reshape(-1, self.action_dim)
+        self._rewards_flat = self.rewards.reshape(-1)
+        self._dones_flat = self.dones.reshape(-1)
+        self._timeouts_flat = self.timeouts.reshape(-1)
+        self._truth_masks_flat = self.truth_masks.reshape(-1, self.truth_masks.shape[-1])
+
     def add(  # type: ignore[override]
         self,
         obs: Dict[str, np.ndarray],
@@ -310,30 +871,33 @@ class DictReplayBuffer(ReplayBuffer):
         infos: List[Dict[str, Any]],
         truth_mask: np.ndarray,
     ) -> None:
-        # Copy to avoid modification by reference
+        # Slice assignment already copies into the storage arrays,
+        # no need for an intermediate `np.array(...)` copy
         for key in self.observations.keys():
             # Reshape needed when using multiple envs with discrete observations
             # as numpy cannot broadcast (n_discrete,) to (n_discrete, 1)
             if isinstance(self.observation_space.spaces[key], spaces.Discrete):
                 obs[key] = obs[key].reshape((self.n_envs,) + self.obs_shape[key])
-            self.observations[key][self.pos] = np.array(obs[key])
+            self.observations[key][:, self.pos] = obs[key]
 
         for key in self.next_observations.keys():
             if isinstance(self.observation_space.spaces[key], spaces.Discrete):
                 next_obs[key] = next_obs[key].reshape((self.n_envs,) + self.obs_shape[key])
-            self.next_observations[key][self.pos] = np.array(next_obs[key])
+            self.next_observations[key][:, self.pos] = next_obs[key]
 
         # Reshape to handle multi-dim and discrete action spaces, see GH #970 #1392
         action = action.reshape((self.n_envs, self.action_dim))
 
-        self.actions[self.pos] = np.array(action)
-        self.rewards[self.pos] = np.array(reward)
-        self.dones[self.pos] = np.array(done)
+        self.actions[:, self.pos] = action
+        self.rewards[:, self.pos] = reward
+        self.dones[:, self.pos] = done
 
         if self.handle_timeout_termination:
-            self.timeouts[self.pos] = np.array([info.get("TimeLimit.truncated", False) for info in infos])
+            for i, info in enumerate(infos):
+                self._timeouts_scratch[i] = info.get("TimeLimit.truncated", False)
+            self.timeouts[:, self.pos] = self._timeouts_scratch
 
-        self.truth_masks[self.pos] = np.array(truth_mask)
+        self._store_truth_mask(truth_mask)
 
         self.pos += 1
         if self.pos == self.buffer_size:
@@ -353,37 +917,118 @@ class DictReplayBuffer(ReplayBuffer):
             to normalize the observations/rewards when sampling
         :return:
         """
-        return super(ReplayBuffer, self).sample(batch_size=batch_size, env=env)
+        upper_bound = self.buffer_size if self.full else self.pos
+        batch_inds = self._rng.integers(0, upper_bound, size=batch_size, dtype=np.int64)
+        return self._get_samples(batch_inds, env=env)
+
+    def sample_combined(  # type: ignore[override]
+        self, batch_size: int, n_combined: int, env: Optional[VecNormalize] = None
+    ) -> Generator[DictReplayBufferSamples, None, None]:
+        """
+        Sample ``n_combined`` minibatches in one combined draw.
+
+        See :meth:`ReplayBuffer.sample_combined`.
+
+        :param batch_size: Number of elements per minibatch
+        :param n_combined: Number of minibatches to prepare at once
+        :param env: associated gym VecEnv
+            to normalize the observations/rewards when sampling
+        :return: Iterator over ``n_combined`` minibatches
+        """
+        combined = self.sample(batch_size * n_combined, env=env)
+        for i in range(n_combined):
+            start, stop = i * batch_size, (i + 1) * batch_size
+            yield DictReplayBufferSamples(
+                observations={key: obs[start:stop] for key, obs in combined.observations.items()},
+                actions=combined.actions[start:stop],
+                next_observations={key: obs[start:stop] for key, obs in combined.next_observations.items()},
+                dones=combined.dones[start:stop],
+                rewards=combined.rewards[start:stop],
+                truth_masks=combined.truth_masks[start:stop],
+            )
 
     def _get_samples(  # type: ignore[override]
         self,
         batch_inds: np.ndarray,
         env: Optional[VecNormalize] = None,
     ) -> DictReplayBufferSamples:
-        # Sample randomly the env idx
-        env_indices = np.random.randint(0, high=self.n_envs, size=(len(batch_inds),))
+        batch_size = len(batch_inds)
+
+        if self._pin_memory:
+            self._staging_slot = 1 - self._staging_slot
+
+        # Single linear index into the flattened (n_envs * buffer_size) axis,
+        # shared by every observation key and every scalar field.
+        # With a single env the only legal env index is 0, so the RNG draw and
+        # the index arithmetic reduce to batch_inds itself
+        if self.n_envs == 1:
+            flat_idx = batch_inds
+        else:
+            # Sample randomly the env idx
+            env_indices = self._rng.integers(0, high=self.n_envs, size=batch_size, dtype=np.int64)
+            flat_idx = env_indices * self.buffer_size + batch_inds
+
+        obs_bufs = {}
+        for key, arr_flat in self._observations_flat.items():
+            buf = self._sample_buf(f"obs_{key}", (batch_size, *self.obs_shape[key]), arr_flat.dtype)
+            np.take(arr_flat, flat_idx, axis=0, out=buf)
+            obs_bufs[key] = buf
+        next_obs_bufs = {}
+        for key, arr_flat in self._next_observations_flat.items():
+            buf = self._sample_buf(f"next_obs_{key}", (batch_size, *self.obs_shape[key]), arr_flat.dtype)
+            np.take(arr_flat, flat_idx, axis=0, out=buf)
+            next_obs_bufs[key] = buf
 
         # Normalize if needed and remove extra dimension (we are using only one env for now)
-        obs_ = self._normalize_obs({key: obs[batch_inds, env_indices, :] for key, obs in self.observations.items()}, env)
-        next_obs_ = self._normalize_obs(
-            {key: obs[batch_inds, env_indices, :] for key, obs in self.next_observations.items()}, env
-        )
+        obs_ = self._normalize_obs(obs_bufs, env)
+        next_obs_ = self._normalize_obs(next_obs_bufs, env)
 
         assert isinstance(obs_, dict)
         assert isinstance(next_obs_, dict)
-        # Convert to torch tensor
-        observations = {key: self.to_torch(obs) for key, obs in obs_.items()}
-        next_observations = {key: self.to_torch(obs) for key, obs in next_obs_.items()}
+
+        actions_buf = self._sample_buf("actions", (batch_size, self.action_dim), self.actions.dtype)
+        np.take(self._actions_flat, flat_idx, axis=0, out=actions_buf)
+
+        rewards_buf = self._sample_buf("rewards", (batch_size, 1), self.rewards.dtype)
+        np.take(self._rewards_flat, flat_idx, axis=0, out=rewards_buf.reshape(-1))
+
+        dones_buf = self._scratch_buf("dones", (batch_size,), self.dones.dtype)
+        np.take(self._dones_flat, flat_idx, axis=0, out=dones_buf)
+
+        timeouts_buf = self._scratch_buf("timeouts", (batch_size,), self.timeouts.dtype)
+        np.take(self._timeouts_flat, flat_idx, axis=0, out=timeouts_buf)
+
+        # Gather the mask bytes, then unpack/widen to float32 once
+        truth_masks_u8 = self._scratch_buf("truth_masks_u8", (batch_size, self.truth_masks.shape[-1]), np.uint8)
+        np.take(self._truth_masks_flat, flat_idx, axis=0, out=truth_masks_u8)
+        truth_masks_buf = self._sample_buf("truth_masks", (batch_size, self.action_space.n), np.float32)
+        if self._pack_masks:
+            np.copyto(truth_masks_buf, np.unpackbits(truth_masks_u8, axis=-1, count=self.action_space.n))
+        else:
+            np.copyto(truth_masks_buf, truth_masks_u8)
+
+        # Only use dones that are not due to timeouts
+        # deactivated by default (timeouts is initialized as an array of False).
+        # Computed with in-place ufuncs into a pooled buffer: no temporaries
+        masked_dones_buf = self._sample_buf("masked_dones", (batch_size, 1), np.float32)
+        masked_dones_flat = masked_dones_buf.reshape(-1)
+        np.subtract(1.0, timeouts_buf, out=masked_dones_flat)
+        np.multiply(dones_buf, masked_dones_flat, out=masked_dones_flat)
+
+        fields: Dict[str, np.ndarray] = {f"obs_{key}": obs for key, obs in obs_.items()}
+        for key, obs in next_obs_.items():
+            fields[f"next_obs_{key}"] = obs
+        fields["actions"] = actions_buf
+        fields["rewards"] = self._normalize_reward(rewards_buf, env)
+        fields["masked_dones"] = masked_dones_buf
+        fields["truth_masks"] = truth_masks_buf
+        batch = self._transfer_batch(fields)
 
         return DictReplayBufferSamples(
-            observations=observations,
-            actions=self.to_torch(self.actions[batch_inds, env_indices]),
-            next_observations=next_observations,
-            # Only use dones that are not due to timeouts
-            # deactivated by default (timeouts is initialized as an array of False)
-            dones=self.to_torch(self.dones[batch_inds, env_indices] * (1 - self.timeouts[batch_inds, env_indices])).reshape(
-                -1, 1
-            ),
-            rewards=self.to_torch(self._normalize_reward(self.rewards[batch_inds, env_indices].reshape(-1, 1), env)),
-            truth_masks=self.to_torch(self.truth_masks[batch_inds, env_indices]),
+            observations={key: batch[f"obs_{key}"] for key in self.observations.keys()},
+            actions=batch["actions"],
+            next_observations={key: batch[f"next_obs_{key}"] for key in self.observations.keys()},
+            dones=batch["masked_dones"],
+            rewards=batch["rewards"],
+            truth_masks=batch["truth_masks"],
         )
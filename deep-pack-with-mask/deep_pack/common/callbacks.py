@@ -1,3 +1,5 @@
+from typing import Dict, List
+
 import numpy as np
 import time
 import csv
@@ -8,11 +10,14 @@ from stable_baselines3.common.monitor import ResultsWriter
 
 class MetricsCallback(BaseCallback):
     """
-    Custom callback for recording metrics in training process.    
+    Custom callback for recording metrics in training process.
     """
-    
+
     EXT = "metrics.csv"
-    
+    # Rows are buffered and written in batches to amortize the
+    # write + flush syscalls over the training loop
+    FLUSH_EVERY = 16
+
     def __init__(self, filename: str, verbose=0):
         super().__init__(verbose)
         if not filename.endswith(MetricsCallback.EXT):
@@ -22,7 +27,8 @@ class MetricsCallback(BaseCallback):
                 filename = filename + "." + MetricsCallback.EXT
         filename = os.path.realpath(filename)
         mode = "w"
-        self.file_handler = open(filename, f"{mode}t", newline="\n")
+        self.file_handler = open(filename, f"{mode}t", newline="\n", buffering=1 << 20)
+        self._row_buffer: List[Dict] = []
         self.metrics_logger = csv.DictWriter(self.file_handler, fieldnames=(
             "timesteps",
             "ep_rew_mean",
@@ -51,8 +57,16 @@ class MetricsCallback(BaseCallback):
             "n_updates": self.logger.name_to_value['train/n_updates'],
             "learning_rate": self.logger.name_to_value['train/learning_rate'], 
         }
-        self.metrics_logger.writerow(metrics)
-        self.file_handler.flush()
+        self._row_buffer.append(metrics)
+        if len(self._row_buffer) >= MetricsCallback.FLUSH_EVERY:
+            self._flush_rows()
+
+    def _flush_rows(self) -> None:
+        if self._row_buffer:
+            self.metrics_logger.writerows(self._row_buffer)
+            self.file_handler.flush()
+            self._row_buffer.clear()
 
     def _on_training_end(self) -> None:
+        self._flush_rows()
         self.file_handler.close()
\ No newline at end of file
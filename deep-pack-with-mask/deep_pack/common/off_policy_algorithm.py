@@ -252,6 +252,9 @@ class OffPolicyAlgorithm(BaseAlgorithm):
 
         # Update saved replay buffer device to match current setting, see GH#1561
         self.replay_buffer.device = self.device
+        # The sampling staging state (pinned host arenas, device arenas) is
+        # device-dependent: rebuild it now that the device may have changed
+        self.replay_buffer._init_staging()
 
     def _setup_learn(
         self,
@@ -287,7 +290,8 @@ class OffPolicyAlgorithm(BaseAlgorithm):
             assert replay_buffer is not None  # for mypy
             # Go to the previous index
             pos = (replay_buffer.pos - 1) % replay_buffer.buffer_size
-            replay_buffer.dones[pos] = True
+            # Storage is laid out (n_envs, buffer_size): pos indexes the time axis
+            replay_buffer.dones[:, pos] = True
 
         assert self.env is not None, "You must set the environment before calling _setup_learn()"
         # Vectorize action noise if needed
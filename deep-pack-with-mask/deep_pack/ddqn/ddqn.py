@@ -190,10 +190,17 @@ class DDQN(OffPolicyAlgorithm):
         self._update_learning_rate(self.policy.optimizer)
 
         losses = []
-        for _ in range(gradient_steps):
-            # Sample replay buffer
-            replay_data = self.replay_buffer.sample(batch_size, env=self._vec_normalize_env)  # type: ignore[union-attr]
-
+        if gradient_steps > 1:
+            # Draw all minibatches at once: one index draw and one device
+            # transfer shared across the gradient steps of this update
+            replay_data_iter = self.replay_buffer.sample_combined(  # type: ignore[union-attr]
+                batch_size, gradient_steps, env=self._vec_normalize_env
+            )
+        else:
+            replay_data_iter = iter(
+                [self.replay_buffer.sample(batch_size, env=self._vec_normalize_env)]  # type: ignore[union-attr]
+            )
+        for replay_data in replay_data_iter:
             with th.no_grad():
                 # # Compute the next Q-values using the target network
                 # next_q_values = self.q_net_target(replay_data.next_observations)
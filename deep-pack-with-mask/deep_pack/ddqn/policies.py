@@ -85,15 +85,25 @@ class QNetwork(BasePolicy):
         :param obs: Observation
         :return: The estimated Q-Value for each action.s
         """
+        # Fast path: only the bin image is fed to the network, so when it is
+        # already float32 and no image normalization is requested,
+        # preprocessing the whole observation dict would be a no-op
+        bin_obs = obs[BIN]
+        if bin_obs.dtype == th.float32 and not self.normalize_images:
+            return self.q_net(bin_obs)
         obs = preprocess_obs(obs, self.observation_space, normalize_images=self.normalize_images)
         return self.q_net(obs[BIN])
 
+    @th.inference_mode()
     def _predict(self, observation: PyTorchObs, deterministic: bool = True) -> th.Tensor:
+        # Action selection is pure inference: inference_mode is strictly
+        # cheaper than no_grad (no version-counter bookkeeping at all)
         q_values = self(observation)
-        masked_q_values = th.where(observation[MASK] == 1, q_values, self.mask_replace_coef)
+        # Fill invalid actions in place: one fused kernel instead of the
+        # comparison + full-size result tensor that th.where allocates
+        q_values.masked_fill_(observation[MASK] == 0, self.mask_replace_coef)
         # Greedy action
-        # action = q_values.argmax(dim=1).reshape(-1)
-        action = masked_q_values.argmax(dim=1).reshape(-1)
+        action = q_values.argmax(dim=1).reshape(-1)
         return action
 
     def _get_constructor_parameters(self) -> Dict[str, Any]:
@@ -234,6 +244,7 @@ class DQNPolicy(BasePolicy):
     def forward(self, obs: PyTorchObs, deterministic: bool = True) -> th.Tensor:
         return self._predict(obs, deterministic=deterministic)
 
+    @th.inference_mode()
     def _predict(self, obs: PyTorchObs, deterministic: bool = True) -> th.Tensor:
         return self.q_net._predict(obs, deterministic=deterministic)
 